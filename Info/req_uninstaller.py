@@ -1,14 +1,37 @@
 import sys
 import subprocess
 import os
+import re
+import importlib
+import logging
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout, redirect_stderr
+from importlib.metadata import distributions
 
-# Check for PyQt6 before importing
-try:
+
+def _import_pyqt6():
+    """Import the PyQt6 names the GUI uses"""
     from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                                 QPushButton, QTextEdit, QLabel, QMessageBox, QProgressBar)
-    from PyQt6.QtCore import QThread, pyqtSignal
-    from PyQt6.QtGui import QFont
-except ImportError as e:
+                                 QPushButton, QPlainTextEdit, QLabel, QMessageBox, QProgressBar,
+                                 QCheckBox)
+    from PyQt6.QtCore import QThread, QTimer, pyqtSignal
+    from PyQt6.QtGui import QFont, QTextCursor
+    return (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+            QPushButton, QPlainTextEdit, QLabel, QMessageBox, QProgressBar,
+            QCheckBox, QThread, QTimer, pyqtSignal, QFont, QTextCursor)
+
+
+def _ensure_pyqt6():
+    """Import PyQt6, offering to install it if it's missing. Returns the names from _import_pyqt6()"""
+    try:
+        return _import_pyqt6()
+    except ImportError:
+        pass
+    
     print("=" * 60)
     print("ERROR: PyQt6 is not installed!")
     print("=" * 60)
@@ -20,15 +43,24 @@ except ImportError as e:
         try:
             result = subprocess.run(
                 [sys.executable, "-m", "pip", "install", "PyQt6"],
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             if result.returncode == 0:
                 print("✓ PyQt6 installed successfully!")
-                print("Please run this script again.")
+                # Pick up the new package without restarting the interpreter
+                importlib.invalidate_caches()
+                try:
+                    pyqt6_names = _import_pyqt6()
+                    print("=" * 60)
+                    return pyqt6_names
+                except ImportError:
+                    # e.g. pip fell back to a user site-packages that wasn't on sys.path yet
+                    print("Please run this script again.")
             else:
                 print("✗ Installation failed:")
-                print(result.stderr)
+                # Only decode pip's error output when there is something to show
+                print(result.stderr.decode('utf-8', errors='replace'))
         except Exception as install_error:
             print(f"✗ Installation error: {install_error}")
     else:
@@ -44,6 +76,12 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Check for PyQt6 before using it
+(QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+ QPushButton, QPlainTextEdit, QLabel, QMessageBox, QProgressBar,
+ QCheckBox, QThread, QTimer, pyqtSignal, QFont, QTextCursor) = _ensure_pyqt6()
+
+
 DARK_THEME = """
 QMainWindow, QWidget {
     background-color: #2b2b2b;
@@ -65,7 +103,7 @@ QPushButton:pressed {
 QLabel {
     color: #ffffff;
 }
-QTextEdit {
+QPlainTextEdit {
     background-color: #1e1e1e;
     color: #ffffff;
     border: 1px solid #555555;
@@ -83,6 +121,100 @@ QProgressBar::chunk {
 }
 """
 
+UNINSTALL_BUTTON_QSS = """
+QPushButton#uninstallButton {
+    background-color: #d32f2f;
+    color: #ffffff;
+    font-size: 14px;
+    font-weight: bold;
+    padding: 10px;
+    border: 1px solid #b71c1c;
+    border-radius: 3px;
+}
+QPushButton#uninstallButton:hover {
+    background-color: #b71c1c;
+}
+QPushButton#uninstallButton:pressed {
+    background-color: #a01c1c;
+}
+QPushButton#uninstallButton:disabled {
+    background-color: #2b2b2b;
+    color: #666666;
+}
+"""
+
+# Never uninstalled, otherwise pip can't clean up after itself
+SKIP_PACKAGES = frozenset(("pip", "setuptools", "wheel"))
+
+# Environment for pip child processes: no upgrade banner, unbuffered so output streams line by line
+PIP_ENV = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1", "PYTHONUNBUFFERED": "1"}
+
+# pip's error when it refuses to remove a package, either
+# "Cannot uninstall 'name'. It is a distutils installed project..." or "Cannot uninstall name 1.0, ..."
+CANNOT_UNINSTALL_RE = re.compile(r"Cannot uninstall '?([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# Runs pip once per stdin line ("uninstall -y <pkg>") so one pip import serves many uninstalls.
+# Prints "===DONE <exit code>===" after each command.
+PIP_WORKER_SRC = """
+import sys
+try:
+    from pip._internal.cli.main import main
+except ImportError:
+    import subprocess
+    def main(args):
+        return subprocess.call([sys.executable, "-m", "pip", *args])
+for line in sys.stdin:
+    try:
+        rc = main(line.split())
+    except SystemExit as e:
+        rc = e.code
+    print(f"===DONE {rc}===", flush=True)
+"""
+
+
+def normalize_name(name):
+    """Normalize a package name the way pip compares them (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def get_installed_packages():
+    """Return sorted (name, version) pairs for every installed distribution"""
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue  # Broken install without metadata
+        # The first hit on sys.path wins, same as pip
+        installed.setdefault(normalize_name(name), (name, dist.version))
+    return sorted(installed.values(), key=lambda item: item[0].lower())
+
+
+class LineWriter:
+    """File-like object that hands every complete line written to it to a callback"""
+    encoding = "utf-8"
+    
+    def __init__(self, callback):
+        self.callback = callback
+        self._partial = ""
+        self._lock = threading.Lock()
+    
+    def write(self, text):
+        with self._lock:
+            lines = (self._partial + text).splitlines(keepends=True)
+            self._partial = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+            for line in lines:
+                self.callback(line)
+        return len(text)
+    
+    def flush(self):
+        with self._lock:
+            if self._partial:
+                self.callback(self._partial)
+                self._partial = ""
+    
+    def isatty(self):
+        return False
+
 
 class UninstallThread(QThread):
     """Thread to handle package uninstallation without freezing the GUI"""
@@ -90,83 +222,278 @@ class UninstallThread(QThread):
     finished_signal = pyqtSignal(bool, str)
     progress_signal = pyqtSignal(int, int)  # current, total
     
+    def __init__(self, installed=None, parallel=False):
+        super().__init__()
+        # (name, version) pairs already fetched by the GUI, if any
+        self.installed = installed
+        # One pip call per package instead of a single batched call
+        self.parallel = parallel
+        # One long-lived pip worker process per pool thread in parallel mode, started on first use
+        self._local = threading.local()
+        self._workers = []
+        self._workers_lock = threading.Lock()
+        # Progress updates are throttled, only the latest pending one gets sent
+        self._progress = None
+        self._progress_timer = None
+        self._progress_lock = threading.Lock()
+        self._last_progress = 0.0
+    
+    def report_progress(self, current, total):
+        """Send a progress update, at most every 50 ms. Updates in between are
+        collapsed into the latest one, which a timer sends so it never waits on pip."""
+        with self._progress_lock:
+            self._progress = (current, total)
+            wait = self._last_progress + 0.05 - time.monotonic()
+            if wait <= 0:
+                self._send_progress()
+            elif self._progress_timer is None:
+                self._progress_timer = threading.Timer(wait, self.flush_progress)
+                self._progress_timer.daemon = True
+                self._progress_timer.start()
+    
+    def flush_progress(self):
+        """Send the pending progress update, if any"""
+        with self._progress_lock:
+            if self._progress_timer is not None:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+            self._send_progress()
+    
+    def _send_progress(self):
+        # Caller holds _progress_lock
+        if self._progress is not None:
+            self.progress_signal.emit(*self._progress)
+            self._progress = None
+        self._last_progress = time.monotonic()
+    
+    def finish(self, success, message):
+        """Send any pending progress, then report the result"""
+        self.flush_progress()
+        self.finished_signal.emit(success, message)
+    
+    def uninstall_batch(self, packages):
+        """Uninstall everything in as few pip calls as possible, following pip's output for progress.
+        Returns the packages that failed."""
+        total_packages = len(packages)
+        uninstalled = set()
+        failed = set()
+        
+        def handle_line(line):
+            self.output_signal.emit(line)
+            stripped = line.strip()
+            if stripped.startswith("Successfully uninstalled "):
+                # "Successfully uninstalled <name>-<version>"
+                dist = stripped[len("Successfully uninstalled "):]
+                uninstalled.add(normalize_name(dist.rpartition('-')[0]))
+            elif stripped.startswith("WARNING: Skipping "):
+                # Already gone (e.g. removed as part of another package)
+                uninstalled.add(normalize_name(stripped.split()[2]))
+            elif match := CANNOT_UNINSTALL_RE.search(stripped):
+                failed.add(normalize_name(match.group(1)))
+            else:
+                return
+            self.report_progress(len(uninstalled) + len(failed), total_packages)
+        
+        # pip aborts the whole command at the first package it can't uninstall,
+        # so keep going with whatever is left until nothing changes
+        remaining = packages
+        while remaining:
+            done_before = len(uninstalled) + len(failed)
+            self.run_pip_uninstall(remaining, handle_line)
+            remaining = [pkg for pkg in remaining
+                         if normalize_name(pkg) not in uninstalled and normalize_name(pkg) not in failed]
+            if len(uninstalled) + len(failed) == done_before:
+                # pip failed without naming a package, give up on the rest
+                failed.update(normalize_name(pkg) for pkg in remaining)
+                break
+        
+        return [pkg for pkg in packages if normalize_name(pkg) in failed]
+    
+    def run_pip_uninstall(self, packages, handle_line):
+        """Run a single 'pip uninstall' for the given packages, passing each output line to handle_line"""
+        # Pass the packages through a requirements file, the command line tops out
+        # around 32K characters on Windows which large environments can exceed
+        with tempfile.NamedTemporaryFile("w", delete=False, suffix=".txt") as f:
+            f.write("\n".join(packages))
+            path = f.name
+        
+        try:
+            # No -q here, the "Successfully uninstalled" lines drive the progress bar
+            args = ["--disable-pip-version-check", "uninstall", "-y", "-r", path]
+            if not self.run_pip_in_process(args, handle_line):
+                proc = subprocess.Popen(
+                    [sys.executable, "-m", "pip", *args],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    env=PIP_ENV
+                )
+                for line in proc.stdout:
+                    handle_line(line)
+                proc.wait()
+        finally:
+            os.remove(path)
+    
+    def run_pip_in_process(self, args, handle_line):
+        """Run pip inside this interpreter to skip process startup and pip's import.
+        Returns False if pip's internal API isn't available, so the caller can fall back to a subprocess."""
+        try:
+            # Not a public API, only exists in pip >= 19.3
+            from pip._internal.cli.main import main as pip_main
+        except ImportError:
+            return False
+        
+        # pip configures logging and warnings for the whole process, put them back
+        # afterwards so later log records don't end up in this run's writer
+        root_handlers = logging.root.handlers[:]
+        root_level = logging.root.level
+        showwarning = warnings.showwarning
+        
+        writer = LineWriter(handle_line)
+        try:
+            with redirect_stdout(writer), redirect_stderr(writer):
+                try:
+                    pip_main(args)
+                except SystemExit:
+                    pass
+        finally:
+            logging.root.handlers[:] = root_handlers
+            logging.root.setLevel(root_level)
+            warnings.showwarning = showwarning
+        writer.flush()
+        return True
+    
+    def uninstall_parallel(self, packages):
+        """Uninstall each package in its own pip call, several at a time.
+        Returns the packages that failed."""
+        failed_packages = []
+        total_packages = len(packages)
+        workers = min(8, os.cpu_count() or 1)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self.uninstall_one, pkg): pkg for pkg in packages}
+                for done, future in enumerate(as_completed(futures), 1):
+                    pkg_name = futures[future]
+                    error = future.result()
+                    self.report_progress(done, total_packages)
+                    if error is None:
+                        self.output_signal.emit(f"[{done}/{total_packages}] {pkg_name} ✓ Success\n")
+                    else:
+                        self.output_signal.emit(f"[{done}/{total_packages}] {pkg_name} ✗ Failed\n")
+                        failed_packages.append(pkg_name)
+                        if error:
+                            self.output_signal.emit(f"   Error: {error}\n")
+        finally:
+            for worker in self._workers:
+                try:
+                    worker.stdin.close()  # EOF ends the worker's loop
+                except OSError:
+                    pass  # Worker already died
+                try:
+                    worker.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    worker.kill()
+                    worker.wait()
+            self._workers.clear()
+        
+        return failed_packages
+    
+    def get_worker(self):
+        """Return this thread's pip worker process, starting it if needed"""
+        worker = getattr(self._local, "worker", None)
+        if worker is None or worker.poll() is not None:
+            worker = subprocess.Popen(
+                [sys.executable, "-u", "-c", PIP_WORKER_SRC],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=PIP_ENV
+            )
+            self._local.worker = worker
+            with self._workers_lock:
+                self._workers.append(worker)
+        return worker
+    
+    def uninstall_one(self, pkg_name):
+        """Uninstall a single package. Returns None on success, otherwise pip's error output"""
+        worker = self.get_worker()
+        try:
+            worker.stdin.write(f"--disable-pip-version-check -q uninstall -y {pkg_name}\n".encode())
+            worker.stdin.flush()
+        except OSError as e:
+            # Worker died between packages, don't rely on poll() having noticed yet
+            self._local.worker = None
+            return f"pip worker exited unexpectedly: {e}"
+        
+        output = []
+        for line in worker.stdout:
+            if line.startswith(b"===DONE "):
+                if line.strip() == b"===DONE 0===":
+                    return None
+                # Only decode pip's output when there is an error to show
+                return b"".join(output).decode('utf-8', errors='replace').strip()
+            output.append(line)
+        self._local.worker = None
+        return "pip worker exited unexpectedly"
+    
     def run(self):
         try:
             # Get list of installed packages
             self.output_signal.emit("Fetching list of installed packages...\n")
-            self.progress_signal.emit(0, 0)  # Indeterminate progress
-            
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "list", "--format=freeze"],
-                capture_output=True,
-                text=True
-            )
+            self.report_progress(0, 0)  # Indeterminate progress
             
-            if result.returncode != 0:
-                self.finished_signal.emit(False, "Failed to get package list")
-                return
-            
-            # Parse package names (exclude pip, setuptools, and wheel to avoid issues)
-            packages = []
-            for line in result.stdout.strip().split('\n'):
-                if line and '==' in line:
-                    pkg_name = line.split('==')[0]
-                    # Skip critical packages
-                    if pkg_name.lower() not in ['pip', 'setuptools', 'wheel']:
-                        packages.append(pkg_name)
+            # Collect package names (exclude pip, setuptools, and wheel to avoid issues)
+            installed = self.installed if self.installed is not None else get_installed_packages()
+            packages = [name for name, _ in installed if normalize_name(name) not in SKIP_PACKAGES]
             
             if not packages:
-                self.finished_signal.emit(True, "No packages to uninstall")
+                self.finish(True, "No packages to uninstall")
                 return
             
             total_packages = len(packages)
             self.output_signal.emit(f"Found {total_packages} packages to uninstall\n")
-            self.output_signal.emit(f"Packages: {', '.join(packages)}\n\n")
+            # Listing hundreds of names in one line just stalls the log, the count is enough
+            if total_packages <= 50:
+                self.output_signal.emit(f"Packages: {', '.join(packages)}\n\n")
+            else:
+                self.output_signal.emit(f"(package list omitted; {total_packages} items)\n\n")
             
-            # Uninstall packages one by one to show progress
             self.output_signal.emit("Uninstalling packages...\n")
             self.output_signal.emit("-" * 60 + "\n")
+            self.report_progress(0, total_packages)
             
-            failed_packages = []
-            
-            for i, pkg_name in enumerate(packages, 1):
-                self.progress_signal.emit(i, total_packages)
-                self.output_signal.emit(f"[{i}/{total_packages}] Uninstalling {pkg_name}...")
-                
-                uninstall_result = subprocess.run(
-                    [sys.executable, "-m", "pip", "uninstall", "-y", pkg_name],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if uninstall_result.returncode == 0:
-                    self.output_signal.emit(" ✓ Success\n")
-                else:
-                    self.output_signal.emit(f" ✗ Failed\n")
-                    failed_packages.append(pkg_name)
-                    if uninstall_result.stderr:
-                        self.output_signal.emit(f"   Error: {uninstall_result.stderr}\n")
+            if self.parallel:
+                failed_packages = self.uninstall_parallel(packages)
+            else:
+                failed_packages = self.uninstall_batch(packages)
             
             self.output_signal.emit("\n" + "-" * 60 + "\n")
             
             if not failed_packages:
-                self.finished_signal.emit(True, f"Successfully uninstalled {total_packages} packages!")
+                self.finish(True, f"Successfully uninstalled {total_packages} packages!")
             else:
                 self.output_signal.emit(f"\n⚠ Failed to uninstall {len(failed_packages)} packages:\n")
                 for pkg in failed_packages:
                     self.output_signal.emit(f"  - {pkg}\n")
-                self.finished_signal.emit(False, f"Failed to uninstall {len(failed_packages)} packages")
+                self.finish(False, f"Failed to uninstall {len(failed_packages)} packages")
                 
         except Exception as e:
-            self.finished_signal.emit(False, f"Error: {str(e)}")
+            self.finish(False, f"Error: {str(e)}")
 
 
 class PackageUninstallerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.uninstall_thread = None
+        self._package_cache = None  # (name, version) pairs, reset after every uninstall
+        # Output from the uninstall thread is collected here and written to the log in batches
+        self._pending_output = []
+        self._output_timer = QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.timeout.connect(self.flush_output)
         self.init_ui()
-        self.apply_theme()
         
     def init_ui(self):
         self.setWindowTitle("Python Package Uninstaller")
@@ -197,8 +524,9 @@ class PackageUninstallerGUI(QMainWindow):
         main_layout.addWidget(self.progress_bar)
         
         # Output text area
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.setMaximumBlockCount(5000)  # Oldest lines get dropped past this
         self.output_text.setFont(QFont("Courier", 9))
         main_layout.addWidget(self.output_text)
         
@@ -212,29 +540,17 @@ class PackageUninstallerGUI(QMainWindow):
         
         button_layout.addStretch()
         
+        # Parallel mode checkbox
+        self.parallel_checkbox = QCheckBox("Uninstall one by one (parallel)")
+        self.parallel_checkbox.setToolTip(
+            "Run a separate pip uninstall per package, several at once.\n"
+            "Reports failures per package, but packages with uninstall hooks may conflict."
+        )
+        button_layout.addWidget(self.parallel_checkbox)
+        
         # Uninstall button
         self.uninstall_button = QPushButton("🗑️ UNINSTALL ALL PACKAGES")
-        self.uninstall_button.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                border: 1px solid #b71c1c;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #b71c1c;
-            }
-            QPushButton:pressed {
-                background-color: #a01c1c;
-            }
-            QPushButton:disabled {
-                background-color: #2b2b2b;
-                color: #666666;
-            }
-        """)
+        self.uninstall_button.setObjectName("uninstallButton")  # Styled by UNINSTALL_BUTTON_QSS
         self.uninstall_button.clicked.connect(self.confirm_uninstall)
         button_layout.addWidget(self.uninstall_button)
         
@@ -243,17 +559,14 @@ class PackageUninstallerGUI(QMainWindow):
     def show_packages(self):
         """Display currently installed packages"""
         self.output_text.clear()
-        self.output_text.append("Fetching installed packages...\n")
+        self.output_text.appendPlainText("Fetching installed packages...\n")
         
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "list"],
-                capture_output=True,
-                text=True
-            )
-            self.output_text.append(result.stdout)
+            installed = self._package_cache = get_installed_packages()
+            width = max((len(name) for name, _ in installed), default=0)
+            self.output_text.appendPlainText("\n".join(f"{name:<{width}}  {version}" for name, version in installed))
         except Exception as e:
-            self.output_text.append(f"Error: {str(e)}")
+            self.output_text.appendPlainText(f"Error: {str(e)}")
     
     def confirm_uninstall(self):
         """Show confirmation dialog before uninstalling"""
@@ -279,24 +592,41 @@ class PackageUninstallerGUI(QMainWindow):
         self.uninstall_button.setEnabled(False)
         self.info_button.setEnabled(False)
         self.clear_button.setEnabled(False)
+        self.parallel_checkbox.setEnabled(False)
         
         # Show and reset progress bar
         self.progress_bar.setVisible(True)
         self.progress_bar.setMaximum(0)  # Indeterminate mode initially
         self.progress_bar.setValue(0)
         
-        self.uninstall_thread = UninstallThread()
+        self.uninstall_thread = UninstallThread(self._package_cache, self.parallel_checkbox.isChecked())
         self.uninstall_thread.output_signal.connect(self.update_output)
         self.uninstall_thread.progress_signal.connect(self.update_progress)
         self.uninstall_thread.finished_signal.connect(self.uninstall_finished)
         self.uninstall_thread.start()
     
     def update_output(self, text):
-        """Update the output text area"""
-        self.output_text.append(text)
-        # Auto-scroll to bottom
+        """Queue text for the output area, written at most every 30 ms"""
+        self._pending_output.append(text)
+        if not self._output_timer.isActive():
+            self._output_timer.start(30)
+    
+    def flush_output(self):
+        """Write queued text to the output area in one go"""
+        if not self._pending_output:
+            return
+        # Only auto-scroll if the user hasn't scrolled up to read something
         scrollbar = self.output_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        
+        cursor = QTextCursor(self.output_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText("".join(self._pending_output))
+        self._pending_output.clear()
+        
+        if at_bottom:
+            self.output_text.moveCursor(QTextCursor.MoveOperation.End)
+            self.output_text.ensureCursorVisible()
     
     def update_progress(self, current, total):
         """Update the progress bar"""
@@ -309,9 +639,12 @@ class PackageUninstallerGUI(QMainWindow):
     
     def uninstall_finished(self, success, message):
         """Handle completion of uninstallation"""
+        self.flush_output()  # Show the full log before the message box
+        self._package_cache = None
         self.uninstall_button.setEnabled(True)
         self.info_button.setEnabled(True)
         self.clear_button.setEnabled(True)
+        self.parallel_checkbox.setEnabled(True)
         
         # Hide progress bar
         self.progress_bar.setVisible(False)
@@ -320,15 +653,13 @@ class PackageUninstallerGUI(QMainWindow):
             QMessageBox.information(self, "Complete", message)
         else:
             QMessageBox.warning(self, "Error", message)
-    
-    def apply_theme(self):
-        """Apply the dark theme matching your ViewFinder style"""
-        self.setStyleSheet(DARK_THEME)
 
 
 def main():
     try:
         app = QApplication(sys.argv)
+        # Dark theme matching the ViewFinder style, parsed once for the whole app
+        app.setStyleSheet(DARK_THEME + UNINSTALL_BUTTON_QSS)
         window = PackageUninstallerGUI()
         window.show()
         sys.exit(app.exec())